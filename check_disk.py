@@ -5,6 +5,8 @@ DIR_START_SECTOR = 1
 MAX_DISK_FILES = 128
 ENTRY_SIZE = 72
 
+_SIZE_START = struct.Struct('<II')
+
 def check_disk():
     try:
         with open('disk.img', 'rb') as f:
@@ -15,7 +17,7 @@ def check_disk():
                 if not name_bytes:
                     continue
                 
-                size, start = struct.unpack('<II', data[64:72])
+                size, start = _SIZE_START.unpack(data[64:72])
                 name = name_bytes.decode('utf-8', errors='replace')
                 print(f"File {i}: {name}, size={size}, start_sector={start}")
     except Exception as e:
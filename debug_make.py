@@ -9,6 +9,9 @@ DATA_START_SECTOR = 128
 ASSETS_DIR = "assets"
 TARGET_PREFIX = "/system/assets/"
 
+# Same layout as make_disk.py: char name[64], u32 size, u32 start_sector
+_ENTRY = struct.Struct('<64sII')
+
 def debug_make():
     log = []
     log.append(f"CWD: {os.getcwd()}")
@@ -37,11 +40,10 @@ def debug_make():
     dir_offset = DIR_START_SECTOR * SECTOR_SIZE
     for i, entry in enumerate(entries):
         if i >= MAX_DISK_FILES: break
-        name_bytes = entry["name"].encode('utf-8').ljust(64, b'\0')
-        offset = dir_offset + (i * 72)
-        disk_img[offset:offset+64] = name_bytes
-        disk_img[offset+64:offset+68] = struct.pack('<I', entry["size"])
-        disk_img[offset+68:offset+72] = struct.pack('<I', entry["start"])
+        # '64s' null-pads the name, so no ljust or '<I' packs needed
+        _ENTRY.pack_into(disk_img, dir_offset + (i * 72),
+                         entry["name"].encode('utf-8'),
+                         entry["size"], entry["start"])
 
     data_offset = DATA_START_SECTOR * SECTOR_SIZE
     disk_img[data_offset:data_offset+len(data_blob)] = data_blob
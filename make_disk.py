@@ -1,3 +1,4 @@
+import shutil
 import struct
 import os
 
@@ -9,81 +10,83 @@ DIR_START_SECTOR = 1
 DATA_START_SECTOR = 128
 ASSETS_DIR = "assets"
 TARGET_PREFIX = "/system/assets/"
+_TARGET_PREFIX_B = TARGET_PREFIX.encode('utf-8')  # encoded once, not per entry
+
+# Directory entry layout: char name[64], u32 size, u32 start_sector (see diskfs.h)
+_ENTRY = struct.Struct('<64sII')
+assert _ENTRY.size == 72
 
 def main():
     entries = []
     current_sector = DATA_START_SECTOR
-    data_blob = bytearray()
-    
+
     print(f"Scanning directory: {ASSETS_DIR}")
-    if os.path.exists(ASSETS_DIR):
-        files = os.listdir(ASSETS_DIR)
-        print(f"Found {len(files)} files/folders.")
-        for fname in files:
-            fpath = os.path.join(ASSETS_DIR, fname)
-            if os.path.isfile(fpath):
-                dest_name = TARGET_PREFIX + fname
-                print(f"  Adding: {dest_name}")
-                if len(dest_name) >= 64:
-                    print(f"    Warning: Filename too long, skipping: {dest_name}")
-                    continue
-                
-                with open(fpath, 'rb') as f:
-                    content = f.read()
-                
-                size = len(content)
-                start_sector = current_sector
-                
-                entries.append({
-                    "name": dest_name,
-                    "size": size,
-                    "start": start_sector
-                })
-                
-                # Append data and pad to sector boundary
-                data_blob.extend(content)
-                padding = (SECTOR_SIZE - (len(content) % SECTOR_SIZE)) % SECTOR_SIZE
-                data_blob.extend(b'\0' * padding)
-                
-                sectors_used = (len(content) + SECTOR_SIZE - 1) // SECTOR_SIZE
-                current_sector += sectors_used
-    
-    disk_img = bytearray(DISK_SIZE)
-    
-    # Write Directory Table
-    dir_offset = DIR_START_SECTOR * SECTOR_SIZE
-    for i, entry in enumerate(entries):
-        if i >= MAX_DISK_FILES:
-            break
-        
-        # Pack entry: 64s for name, I for size, I for start_sector
-        name_bytes = entry["name"].encode('utf-8')
-        # name_bytes should be at most 63 bytes to leave room for null terminator?
-        # Actually C struct is char[64], so it can be 64 bytes if not used as a string,
-        # but diskfs.c uses strcmp, so it MUST be null-terminated.
-        # So name_bytes must be at most 63 bytes.
-        name_bytes = name_bytes[:63] 
-        
-        # struct.pack('<64sII', ...) will pad the 64s with nulls if name_bytes is shorter.
-        entry_struct = struct.pack('<64sII', name_bytes, entry["size"], entry["start"])
-        
-        offset = dir_offset + (i * 72)
-        disk_img[offset:offset+72] = entry_struct
+    try:
+        # buffering=0 drops Python's BufferedWriter layer, so every write
+        # goes straight to the OS instead of being copied into a
+        # user-space buffer first. All our writes start on sector
+        # boundaries already.
+        with open('disk.img', 'wb', buffering=0) as f:
+            # Sparse-allocate the full image instead of materializing a
+            # DISK_SIZE bytearray (or an mmap of the file, which would
+            # dirty a page for every byte touched); regions we never
+            # write read back as zeros.
+            f.truncate(DISK_SIZE)
 
-    # Write Data
-    data_offset = DATA_START_SECTOR * SECTOR_SIZE
-    if len(data_blob) > (DISK_SIZE - data_offset):
-        print("Error: Disk image too small for all files!")
-        return
+            if os.path.exists(ASSETS_DIR):
+                # One scandir pass gives name, type and size per entry
+                # without a stat call per file.
+                with os.scandir(ASSETS_DIR) as scan:
+                    dirents = list(scan)
+                print(f"Found {len(dirents)} files/folders.")
+                for dirent in dirents:
+                    if dirent.is_file():
+                        dest_name = TARGET_PREFIX + dirent.name
+                        print(f"  Adding: {dest_name}")
+                        if len(dest_name) >= 64:
+                            print(f"    Warning: Filename too long, skipping: {dest_name}")
+                            continue
 
-    disk_img[data_offset:data_offset+len(data_blob)] = data_blob
-    
-    try:
-        with open('disk.img', 'wb') as f:
-            f.write(disk_img)
-            f.flush()
+                        size = dirent.stat().st_size
+                        sectors_used = (size + SECTOR_SIZE - 1) // SECTOR_SIZE
+                        if (current_sector + sectors_used) * SECTOR_SIZE > DISK_SIZE:
+                            print("Error: Disk image too small for all files!")
+                            return
+
+                        # Stream straight into the image at the file's sector;
+                        # the tail of the last sector stays zero because the
+                        # next seek skips over it.
+                        f.seek(current_sector * SECTOR_SIZE)
+                        with open(dirent.path, 'rb') as src:
+                            shutil.copyfileobj(src, f, length=1 << 20)
+
+                        entries.append({
+                            "name_b": _TARGET_PREFIX_B + dirent.name.encode('utf-8'),
+                            "size": size,
+                            "start": current_sector
+                        })
+                        current_sector += sectors_used
+
+            # Build Directory Table
+            dir_buf = bytearray(72 * min(len(entries), MAX_DISK_FILES))
+            for i, entry in enumerate(entries[:MAX_DISK_FILES]):
+                # diskfs.c uses strcmp on the name, so it must stay
+                # null-terminated: cap at 63 bytes and let the '64s'
+                # format null-pad the rest.
+                _ENTRY.pack_into(dir_buf, i * 72,
+                                 entry["name_b"][:63], entry["size"], entry["start"])
+
+            # The directory table and data regions are not contiguous
+            # (sectors 1 vs 128), so they cannot be one coalesced write;
+            # pwrite at least drops the extra seek syscall where it exists
+            # (it does not on Windows).
+            if hasattr(os, 'pwrite'):
+                os.pwrite(f.fileno(), dir_buf, DIR_START_SECTOR * SECTOR_SIZE)
+            else:
+                f.seek(DIR_START_SECTOR * SECTOR_SIZE)
+                f.write(dir_buf)
             os.fsync(f.fileno())
-        print(f"Created disk.img ({len(disk_img)} bytes) with {len(entries)} files.")
+        print(f"Created disk.img ({DISK_SIZE} bytes) with {len(entries)} files.")
     except OSError as e:
         print(f"Error: Could not write 'disk.img': {e}")
         if e.errno == 22:
@@ -30,6 +30,10 @@ DATA_START     = 128
 # DISK_IMG_SIZE is computed dynamically from asset sizes (see build_disk_image)
 DISK_IMG_MIN   = 32 * 1024 * 1024   # 32 MB minimum
 
+# Directory entry layout: char name[64], u32 size, u32 start_sector (see diskfs.h)
+_ENTRY = struct.Struct("<64sII")
+assert _ENTRY.size == 72
+
 # ── Helpers ───────────────────────────────────────────────────────────
 
 def is_admin():
@@ -237,7 +241,7 @@ def visualize_write(disk, all_parts, target_part, disk_image_bytes):
 def build_disk_image():
     entries = []
     current_sector = DATA_START
-    data_blob = bytearray()
+    paths = []  # source path per entry, read once the image is sized
 
     print(f"\n[diskfs] Scanning: {ASSETS_DIR}")
     if os.path.exists(ASSETS_DIR):
@@ -250,18 +254,15 @@ def build_disk_image():
             if len(dest) >= 64:
                 print(f"  skip (name too long): {dest}")
                 continue
-            with open(fpath, "rb") as f:
-                content = f.read()
-            entries.append({"name": dest, "size": len(content), "start": current_sector})
-            data_blob.extend(content)
-            pad = (SECTOR_SIZE - (len(content) % SECTOR_SIZE)) % SECTOR_SIZE
-            data_blob.extend(b'\x00' * pad)
-            current_sector += (len(content) + SECTOR_SIZE - 1) // SECTOR_SIZE
-            print(f"  + {dest}  ({len(content):,} bytes)")
+            size = os.path.getsize(fpath)
+            entries.append({"name": dest, "size": size, "start": current_sector})
+            paths.append(fpath)
+            current_sector += (size + SECTOR_SIZE - 1) // SECTOR_SIZE
+            print(f"  + {dest}  ({size:,} bytes)")
 
     # Auto-size: header + data + 20% headroom, minimum DISK_IMG_MIN
-    header_bytes = DATA_START * SECTOR_SIZE           # 128 sectors = 64 KB
-    needed = header_bytes + len(data_blob)
+    data_bytes = (current_sector - DATA_START) * SECTOR_SIZE
+    needed = DATA_START * SECTOR_SIZE + data_bytes    # header = 128 sectors = 64 KB
     disk_img_size = max(DISK_IMG_MIN, int(needed * 1.2))
     # Round up to sector boundary
     disk_img_size = ((disk_img_size + SECTOR_SIZE - 1) // SECTOR_SIZE) * SECTOR_SIZE
@@ -272,15 +273,19 @@ def build_disk_image():
     dir_off = DIR_START * SECTOR_SIZE
     for i, e in enumerate(entries[:MAX_DISK_FILES]):
         name_b = e["name"].encode("utf-8")[:63]
-        rec = struct.pack("<64sII", name_b, e["size"], e["start"])
-        img[dir_off + i*72 : dir_off + i*72 + 72] = rec
+        _ENTRY.pack_into(img, dir_off + i*72, name_b, e["size"], e["start"])
 
-    # File data
-    data_off = DATA_START * SECTOR_SIZE
-    if data_off + len(data_blob) > disk_img_size:
+    # File data: read each file straight into the image at its sector
+    # offset. The bytearray is already zeroed, so sector padding needs
+    # no explicit zero-fill writes.
+    if DATA_START * SECTOR_SIZE + data_bytes > disk_img_size:
         print("[diskfs] ERROR: image overflow even after auto-sizing!")
         sys.exit(1)
-    img[data_off : data_off + len(data_blob)] = data_blob
+    view = memoryview(img)
+    for e, fpath in zip(entries, paths):
+        off = e["start"] * SECTOR_SIZE
+        with open(fpath, "rb") as f:
+            f.readinto(view[off : off + e["size"]])
 
     print(f"[diskfs] Built: {len(entries)} file(s), image size {len(img):,} bytes")
     return bytes(img)
@@ -1,5 +1,6 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 BOOT_DIR = "outputs/boot"
 FIRMWARE_DIR = "firmware"
@@ -8,19 +9,10 @@ SOCCONFIG_DIR = "SoCConfig"
 # delete boot directory if exists
 if os.path.exists(BOOT_DIR):
     shutil.rmtree(BOOT_DIR)
-    
+
 # Create boot directory
 os.makedirs(BOOT_DIR, exist_ok=True)
 
-# Copy kernel
-shutil.copy("temp/binaries/kernel8.img",
-            f"{BOOT_DIR}/kernel8.img")
-
-
-
-shutil.copy("disk.img", f"{BOOT_DIR}/disk.img")  # Also available at raw sector 65536 via make_sd_image.py
-
-# Copy firmware
 dont_ship = [
     "kernel8.img",
     "kernel_2712.img",
@@ -31,33 +23,43 @@ dont_ship = [
     "cmdline.txt"
 ]
 
+copy_these_from_soc_config = [
+    "cmdline.txt",
+    "config.txt"
+]
+
+# Collect every (src, dst) pair, then copy them all in one loop
+copies = [
+    # Kernel
+    ("temp/binaries/kernel8.img", f"{BOOT_DIR}/kernel8.img"),
+    ("disk.img", f"{BOOT_DIR}/disk.img"),  # Also available at raw sector 65536 via make_sd_image.py
+]
+
+# Firmware
 for f in os.listdir(FIRMWARE_DIR):
     if f in dont_ship:
         continue
+    copies.append((f"{FIRMWARE_DIR}/{f}", f"{BOOT_DIR}/{f}"))
 
-    src = os.path.join(FIRMWARE_DIR, f)   
-    dst = os.path.join(BOOT_DIR, f)
+for f in copy_these_from_soc_config:
+    copies.append((f"{SOCCONFIG_DIR}/{f}", f"{BOOT_DIR}/{f}"))
 
+def copy_one(src, dst):
     if not os.path.exists(src):
-        raise FileNotFoundError(f"Missing firmware file: {src}")
+        raise FileNotFoundError(f"Missing boot file: {src}")
 
     if os.path.isdir(src):
         shutil.copytree(src, dst)
     else:
-        shutil.copy(src, dst)
-
-copy_these_from_soc_config = [
-    "cmdline.txt",
-    "config.txt"
-]
-
-for f in copy_these_from_soc_config:
-    src = os.path.join(SOCCONFIG_DIR, f)
-    dst = os.path.join(BOOT_DIR, f)
-
-    if not os.path.exists(src):
-        raise FileNotFoundError(f"Missing SoCConfig file: {src}")
-
-    shutil.copy(src, dst)
+        # copyfile takes the platform fast path (sendfile / CopyFile2)
+        # and skips the stat+chmod that shutil.copy does per file
+        shutil.copyfile(src, dst)
+
+# The copies are independent, so overlap them like the move scripts do;
+# result() re-raises the first failure (e.g. a missing firmware file)
+with ThreadPoolExecutor(max_workers=8) as pool:
+    futures = [pool.submit(copy_one, src, dst) for src, dst in copies]
+for fut in futures:
+    fut.result()
 
 print("Boot partition ready.")
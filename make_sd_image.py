@@ -14,6 +14,7 @@ Assumes:
   - disk.img exists in the project root (from make_disk.py)
 """
 import os
+import shutil
 import struct
 
 BOOT_DIR     = "outputs/boot"
@@ -24,6 +25,15 @@ DISK_OFFSET  = 65536                          # sector offset for disk.img
 DISK_BYTE_OFF = DISK_OFFSET * SECTOR_SIZE     # 32 MB
 TOTAL_SIZE   = 64 * 1024 * 1024               # 64 MB image (expandable)
 
+# 16-byte MBR partition entry: status, CHS start, type, CHS end, LBA start, LBA size
+_MBR_PART = struct.Struct('<BBBBBBBBII')
+
+def pack_partition(status, ptype, start_lba, size_lba):
+    """Pack a 16-byte MBR partition entry (CHS fields set to 0)."""
+    return _MBR_PART.pack(status, 0, 0, 0,      # status, CHS start
+                          ptype, 0, 0, 0,        # type, CHS end
+                          start_lba, size_lba)
+
 def main():
     if not os.path.isdir(BOOT_DIR):
         print(f"ERROR: {BOOT_DIR} not found.  Run make_rpi_boot.py first.")
@@ -33,23 +43,13 @@ def main():
         return
 
     # ---- collect boot files ----
-    boot_files = {}
-    for fname in os.listdir(BOOT_DIR):
-        fpath = os.path.join(BOOT_DIR, fname)
-        if os.path.isfile(fpath):
-            with open(fpath, "rb") as f:
-                boot_files[fname] = f.read()
+    boot_files = [fname for fname in os.listdir(BOOT_DIR)
+                  if os.path.isfile(os.path.join(BOOT_DIR, fname))]
 
-    # ---- read disk.img ----
-    with open(DISK_IMG, "rb") as f:
-        disk_data = f.read()
+    disk_size = os.path.getsize(DISK_IMG)
 
-    # ---- build raw image ----
-    img_size = max(TOTAL_SIZE, DISK_BYTE_OFF + len(disk_data))
-    img = bytearray(img_size)
-
-    # Write disk.img at raw offset
-    img[DISK_BYTE_OFF:DISK_BYTE_OFF + len(disk_data)] = disk_data
+    # ---- image size ----
+    img_size = max(TOTAL_SIZE, DISK_BYTE_OFF + disk_size)
 
     # Write a simple MBR with two partitions:
     #   Partition 1: FAT32, sector 2048 → sector 65535  (~31 MB)
@@ -57,14 +57,7 @@ def main():
     boot_part_start  = 2048
     boot_part_sectors = DISK_OFFSET - boot_part_start     # 63488 sectors
     disk_part_start   = DISK_OFFSET
-    disk_part_sectors = (len(disk_data) + SECTOR_SIZE - 1) // SECTOR_SIZE
-
-    def pack_partition(status, ptype, start_lba, size_lba):
-        """Pack a 16-byte MBR partition entry (CHS fields set to 0)."""
-        return struct.pack('<BBBBBBBBII',
-                           status, 0, 0, 0,      # status, CHS start
-                           ptype, 0, 0, 0,        # type, CHS end
-                           start_lba, size_lba)
+    disk_part_sectors = (disk_size + SECTOR_SIZE - 1) // SECTOR_SIZE
 
     # MBR at sector 0
     mbr = bytearray(512)
@@ -75,38 +68,49 @@ def main():
     # MBR signature
     mbr[510] = 0x55
     mbr[511] = 0xAA
-    img[0:512] = mbr
-
-    # ---- Write boot files into the boot partition area ----
-    # We write them sequentially starting at the boot partition offset.
-    # NOTE: This is a RAW copy, NOT a proper FAT32 filesystem.
-    # For a proper boot partition, the user should format the SD card's
-    # first partition as FAT32 and copy the files manually, OR use a
-    # tool like mtools.
-    #
-    # For automated flashing, the recommended workflow is:
-    #   1. Copy outputs/boot/* files to the FAT32 partition on the SD card
-    #   2. dd if=disk.img of=/dev/sdX seek=65536 bs=512
-    #
-    # This script creates the raw image for reference / dd flashing.
-
-    boot_offset = boot_part_start * SECTOR_SIZE
-    for fname, data in boot_files.items():
-        # Store files linearly (not FAT32 — for documentation/debug)
-        end = boot_offset + len(data)
-        if end <= DISK_BYTE_OFF:
-            img[boot_offset:end] = data
-            boot_offset = end
-            # Pad to sector boundary
-            pad = (SECTOR_SIZE - (boot_offset % SECTOR_SIZE)) % SECTOR_SIZE
-            boot_offset += pad
 
+    # ---- stream everything into the output image ----
+    # Instead of staging a 64 MB bytearray (plus full copies of disk.img
+    # and every boot file) in memory, sparse-allocate the output and
+    # copyfileobj each source straight in with a 1 MB buffer.
     os.makedirs(os.path.dirname(OUTPUT) or '.', exist_ok=True)
-    with open(OUTPUT, "wb") as f:
-        f.write(img)
+    with open(OUTPUT, "wb") as out:
+        out.truncate(img_size)
+        out.write(mbr)
+
+        # ---- Write boot files into the boot partition area ----
+        # We write them sequentially starting at the boot partition offset.
+        # NOTE: This is a RAW copy, NOT a proper FAT32 filesystem.
+        # For a proper boot partition, the user should format the SD card's
+        # first partition as FAT32 and copy the files manually, OR use a
+        # tool like mtools.
+        #
+        # For automated flashing, the recommended workflow is:
+        #   1. Copy outputs/boot/* files to the FAT32 partition on the SD card
+        #   2. dd if=disk.img of=/dev/sdX seek=65536 bs=512
+        #
+        # This script creates the raw image for reference / dd flashing.
+        boot_offset = boot_part_start * SECTOR_SIZE
+        for fname in boot_files:
+            fpath = os.path.join(BOOT_DIR, fname)
+            # Store files linearly (not FAT32 — for documentation/debug)
+            end = boot_offset + os.path.getsize(fpath)
+            if end <= DISK_BYTE_OFF:
+                out.seek(boot_offset)
+                with open(fpath, "rb") as src:
+                    shutil.copyfileobj(src, out, length=1 << 20)
+                boot_offset = end
+                # Pad to sector boundary
+                pad = (SECTOR_SIZE - (boot_offset % SECTOR_SIZE)) % SECTOR_SIZE
+                boot_offset += pad
+
+        # Write disk.img at raw offset
+        out.seek(DISK_BYTE_OFF)
+        with open(DISK_IMG, "rb") as src:
+            shutil.copyfileobj(src, out, length=1 << 20)
 
     print(f"Created {OUTPUT}")
-    print(f"  Total size:     {len(img)} bytes ({len(img)//1024//1024} MB)")
+    print(f"  Total size:     {img_size} bytes ({img_size//1024//1024} MB)")
     print(f"  Boot partition: sector {boot_part_start} – {boot_part_start + boot_part_sectors - 1}")
     print(f"  Disk data:      sector {disk_part_start} – {disk_part_start + disk_part_sectors - 1}")
     print()
@@ -0,0 +1,67 @@
+"""Shared file lists and move-loop helpers for move_files.py,
+copy_files_py.py and move_headers.py, so the command/app lists live in
+one place."""
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# linux/fs.h FICLONE: clone the source file's blocks into the destination
+# (reflink on btrfs/XFS) — a metadata-only copy, no data moved.
+_FICLONE = 0x40049409
+
+commands = [
+    "echo.c", "help.c", "touch.c", "ls.c", "rm.c", "mkdir.c", "rmdir.c", "cp.c", "mv.c", "grep.c",
+    "head.c", "tail.c", "more.c", "tree.c", "edit.c", "view.c", "clear.c", "ps.c", "free.c",
+    "kill.c", "sleep.c", "wait.c", "systemctl.c", "ramfs_tools.c", "cat.c"
+]
+
+apps = [
+    "calculator_app.c", "myra_app.c", "terminal_app.c", "files_app.c", "keyboard_tester_app.c"
+]
+
+def reflink_or_copy(src, dst):
+    """Copy src to dst, cloning blocks when the filesystem supports
+    reflinks; otherwise fall back to shutil.copyfile's platform fast
+    path (sendfile on Linux, CopyFile2 on Windows)."""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass  # filesystem can't reflink between these files
+    shutil.copyfile(src, dst)
+
+def kernel_moves():
+    """(src, dst) pairs relocating command/app sources under kernel/."""
+    moves = [("kernel/v_edit.c", "kernel/apps/editor_app.c")]
+    moves += [(f"kernel/{f}", f"kernel/commands/{f}") for f in commands]
+    moves += [(f"kernel/{f}", f"kernel/apps/{f}") for f in apps]
+    return moves
+
+def run_moves(move_one, moves, max_workers=8):
+    """Run independent (src, dst) moves on a thread pool.
+
+    move_one returns None on success or a message (skip reason / error)
+    to surface. Sources already relocated by an earlier run are filtered
+    out up front, so re-invoking a move script after everything has
+    moved costs one stat per entry and never spins up the pool.
+    """
+    pending = [(src, dst) for src, dst in moves if os.path.exists(src)]
+    already = len(moves) - len(pending)
+    problems = []
+    if pending:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for result in pool.map(lambda m: move_one(m[0], m[1]), pending):
+                if result:
+                    problems.append(result)
+    # One summary line instead of a print per file — per-worker prints
+    # interleave and serialize on stdout
+    print(f"{len(pending) - len(problems)} moved, {already} already moved or missing")
+    for msg in problems:
+        print(f"  {msg}")
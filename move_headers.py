@@ -1,5 +1,7 @@
+import errno
 import os
-import shutil
+
+from move_common import reflink_or_copy, run_moves
 
 moves = [
     ("kernel/calculator_app.h", "kernel/apps/calculator_app.h"),
@@ -8,27 +10,36 @@ moves = [
     ("kernel/terminal_app.h", "kernel/apps/terminal_app.h"),
     ("kernel/keyboard_tester_app.h", "kernel/apps/keyboard_tester_app.h"),
     ("kernel/editor_app.h", "kernel/apps/editor_app.h"),
-    ("kernel/v_edit.h", "kernel/apps/editor_app.h"), # Check strictly if this exists
+    ("kernel/v_edit.h", "kernel/apps/editor_app.h"),
     ("kernel/image_viewer.h", "kernel/apps/image_viewer.h"),
     ("kernel/image_viewer.c", "kernel/apps/image_viewer.c")
 ]
 
-for src, dst in moves:
-    if os.path.exists(src):
+def move_one(src, dst):
+    try:
         try:
-            # Check if rename (editor_app.h might be target of v_edit.h or existing file)
-            if src == "kernel/v_edit.h" and os.path.exists("kernel/apps/editor_app.h"):
-                 print(f"Skipping {src} -> {dst} (target exists)")
-                 continue
-            
-            # Copy and delete to be safe
-            with open(src, 'rb') as f_src:
-                data = f_src.read()
-            with open(dst, 'wb') as f_dst:
-                f_dst.write(data)
+            # Same filesystem: atomic rename, no data copied; overwrites
+            # an existing target, which is what header consolidation wants
+            os.replace(src, dst)
+        except FileNotFoundError:
+            return f"Skipping {src} (not found)"
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-device: fall back to copy + unlink. Tries a reflink
+            # first (EXDEV across btrfs subvolumes can still clone), then
+            # shutil.copyfile's zero-copy path.
+            reflink_or_copy(src, dst)
             os.remove(src)
-            print(f"Moved {src} to {dst}")
-        except Exception as e:
-            print(f"Error moving {src}: {e}")
-    else:
-        print(f"Skipping {src} (not found)")
+        return None
+    except Exception as e:
+        return f"Error moving {src}: {e}"
+
+# v_edit.h is a legacy name for editor_app.h: it only becomes
+# editor_app.h when neither the real header nor an already-moved target
+# exists. Two stats up front replace the old per-move special case and
+# the move ordering it forced.
+if os.path.exists("kernel/editor_app.h") or os.path.exists("kernel/apps/editor_app.h"):
+    moves = [m for m in moves if m[0] != "kernel/v_edit.h"]
+
+run_moves(move_one, moves)